@@ -3,9 +3,9 @@ import argparse
 import sys
 import os
 from pathlib import Path
-from typing import List
+from typing import Dict, List
 from tqdm import tqdm
-from pdf_merger_core import PDFMergerCore, setup_logging
+from pdf_merger_core import PDFMergerCore, PIKEPDF_AVAILABLE, setup_logging
 
 
 class PDFMergerCLI:
@@ -33,6 +33,7 @@ Examples:
         input_group.add_argument(
             'files', 
             nargs='*', 
+            default=[],
             help='PDF files to merge'
         )
         input_group.add_argument(
@@ -80,7 +81,22 @@ Examples:
             help='Overwrite output file if it exists'
         )
         
-        return parser.parse_args()
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=None,
+            metavar='N',
+            help='Number of worker processes used to read input files when merging '
+                 'with PyPDF2; ignored when pikepdf is installed (default: CPU count)'
+        )
+        
+        args = parser.parse_args()
+        if args.workers is not None and args.workers < 1:
+            parser.error('--workers must be at least 1')
+        if args.workers is not None and PIKEPDF_AVAILABLE:
+            print("Warning: --workers has no effect when pikepdf is installed", file=sys.stderr)
+        
+        return args
     
     def load_file_list(self, list_file: str) -> List[str]:
         """Load file paths from a text file."""
@@ -95,20 +111,23 @@ Examples:
             print(f"Error reading input list file: {e}", file=sys.stderr)
             sys.exit(1)
     
-    def validate_files(self, files: List[str]) -> List[str]:
-        """Validate input files and return valid ones."""
+    def validate_files(self, files: List[str], stats: Dict[str, os.stat_result]) -> List[str]:
+        """Validate input files and return valid ones, recording their stat results."""
         valid_files = []
         
         for file_path in files:
-            if not os.path.exists(file_path):
+            try:
+                stats[file_path] = os.stat(file_path)
+            except OSError:
                 print(f"Warning: File not found: {file_path}", file=sys.stderr)
                 continue
                 
-            if not file_path.lower().endswith('.pdf'):
+            _, ext = os.path.splitext(file_path)
+            if ext.lower() != '.pdf':
                 print(f"Warning: Not a PDF file: {file_path}", file=sys.stderr)
                 continue
                 
-            if not self.merger.validate_pdf_file(file_path):
+            if not self.merger.validate_pdf_file(file_path, stats):
                 print(f"Warning: Invalid or corrupted PDF: {file_path}", file=sys.stderr)
                 continue
                 
@@ -116,7 +135,7 @@ Examples:
         
         return valid_files
     
-    def show_file_info(self, files: List[str]):
+    def show_file_info(self, files: List[str], stats: Dict[str, os.stat_result]):
         """Display information about the PDF files."""
         print(f"\n{'='*60}")
         print(f"{'FILE INFORMATION':^60}")
@@ -126,7 +145,7 @@ Examples:
         total_size = 0
         
         for i, file_path in enumerate(files, 1):
-            info = self.merger.get_pdf_info(file_path)
+            info = self.merger.get_pdf_info(file_path, stats)
             size_mb = info['file_size'] / (1024 * 1024)
             
             print(f"\n{i:2d}. {os.path.basename(file_path)}")
@@ -165,9 +184,12 @@ Examples:
             print("Error: No input files specified.", file=sys.stderr)
             sys.exit(1)
         
+        # Each input is stat'ed once for the whole run
+        stats: Dict[str, os.stat_result] = {}
+        
         # Validate files
         print("Validating PDF files...")
-        valid_files = self.validate_files(input_files)
+        valid_files = self.validate_files(input_files, stats)
         
         if not valid_files:
             print("Error: No valid PDF files found.", file=sys.stderr)
@@ -177,7 +199,7 @@ Examples:
         
         # Show file information if requested
         if args.info:
-            self.show_file_info(valid_files)
+            self.show_file_info(valid_files, stats)
         
         # If validate-only mode, exit here
         if args.validate_only:
@@ -203,11 +225,12 @@ Examples:
         
         # Setup progress tracking
         if not args.no_progress:
-            pbar = tqdm(total=len(valid_files), desc="Merging PDFs", unit="file")
+            # Let tqdm rate-limit redraws instead of refreshing on every file
+            pbar = tqdm(total=len(valid_files), desc="Merging PDFs", unit="file",
+                        mininterval=0.1, miniters=max(1, len(valid_files) // 200))
             
             def progress_callback(current: int, total: int):
-                pbar.n = current
-                pbar.refresh()
+                pbar.update(current - pbar.n)
         else:
             pbar = None
             progress_callback = None
@@ -218,7 +241,10 @@ Examples:
             success = self.merger.merge_pdfs(
                 valid_files, 
                 args.output, 
-                progress_callback
+                progress_callback,
+                max_workers=args.workers,
+                presumed_valid=True,
+                stats=stats
             )
             
             if pbar:
@@ -232,7 +258,7 @@ Examples:
                 
                 if args.verbose:
                     # Show summary
-                    info = self.merger.get_file_list_info(valid_files)
+                    info = self.merger.get_file_list_info(valid_files, stats)
                     print(f"  Total input pages: {info['total_pages']}")
                     print(f"  Files processed: {info['valid_files']}/{info['total_files']}")
                     
@@ -1,9 +1,302 @@
+import io
 import os
+import mmap
+import time
+import uuid
+import queue
+import atexit
+import shutil
+import sqlite3
 import logging
-from typing import List, Callable, Optional
+import tempfile
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager, ExitStack
+from dataclasses import dataclass, asdict
+from functools import lru_cache
+from itertools import islice
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
+from typing import IO, Dict, List, Callable, Optional
 from pathlib import Path
 from PyPDF2 import PdfReader, PdfWriter
 from PyPDF2.errors import PdfReadError
+try:
+    import pikepdf
+    PIKEPDF_AVAILABLE = True
+except ImportError:
+    PIKEPDF_AVAILABLE = False
+try:
+    import resource
+except ImportError:
+    resource = None  # Windows
+
+# Writers emit many small chunks (one per object); coalesce them into
+# large writes instead of one syscall each.
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+# Merges whose inputs add up to less than this are serialized in memory
+# and written to disk in a single call.
+IN_MEMORY_OUTPUT_LIMIT = 100 * 1024 * 1024
+
+# Background thread that writes log records queued by setup_logging()
+_log_listener: Optional[QueueListener] = None
+
+# Readers tolerate junk before the header as long as it starts within
+# the first 1 KiB of the file.
+PDF_HEADER = b'%PDF-'
+PDF_HEADER_SEARCH_LIMIT = 1024
+
+# Parsed PDF info is kept across runs in a small SQLite database; entries
+# not refreshed within INFO_CACHE_MAX_AGE seconds are pruned on startup.
+INFO_CACHE_PATH = os.path.join(
+    os.environ.get('PDF_MERGER_CACHE_DIR',
+                   os.path.join(os.path.expanduser('~'), '.cache', 'pdf_merger')),
+    'info.sqlite3'
+)
+INFO_CACHE_MAX_AGE = 30 * 24 * 3600
+
+
+def _max_open_sources() -> int:
+    """
+    Return how many input PDFs pikepdf may hold open at once.
+    
+    Half of the soft file descriptor limit, leaving the rest for the
+    process's other files and sockets.
+    """
+    limit = 512  # Windows' default C runtime limit
+    if resource is not None:
+        try:
+            soft, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+            if soft != resource.RLIM_INFINITY:
+                limit = soft
+            else:
+                limit = 4096
+        except (ValueError, OSError):
+            pass
+    return max(2, limit // 2)
+
+
+# Sources held open by pikepdf merges across every thread of this process
+OPEN_SOURCE_LIMIT = _max_open_sources()
+_open_sources = 0
+_open_sources_changed = threading.Condition()
+
+
+@contextmanager
+def _reserve_sources(count: int):
+    """
+    Hold count of the process-wide open source slots until the block exits.
+    
+    A batch reserves all its slots at once, so concurrent merges wait for
+    each other instead of each holding part of what it needs.
+    """
+    global _open_sources
+    with _open_sources_changed:
+        _open_sources_changed.wait_for(
+            lambda: _open_sources + count <= OPEN_SOURCE_LIMIT)
+        _open_sources += count
+    try:
+        yield
+    finally:
+        with _open_sources_changed:
+            _open_sources -= count
+            _open_sources_changed.notify_all()
+
+
+@contextmanager
+def _open_mmap(file_path: str, will_need: bool = False):
+    """
+    Open a file as a read-only memory map that PdfReader can parse directly.
+    
+    Pass will_need when the whole file is about to be read, so the kernel
+    starts paging it in ahead of the parser.
+    """
+    with open(file_path, 'rb') as file, \
+            mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        if will_need and hasattr(mmap, 'MADV_WILLNEED'):
+            mapped.madvise(mmap.MADV_WILLNEED)
+        yield mapped
+
+
+def _prefetch(file_path: str):
+    """Hint the kernel to start reading a file into the page cache (best-effort)."""
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass
+
+
+@contextmanager
+def _replace_when_done(output_path: str):
+    """
+    Yield a temporary path beside output_path, then move it over output_path.
+    
+    os.replace() is an atomic rename within the directory, so readers see
+    either the old output or the complete new one, never a partial write.
+    The temporary file is removed if the block raises.
+    """
+    temp_path = f"{output_path}.{uuid.uuid4().hex[:8]}.part"
+    try:
+        yield temp_path
+        os.replace(temp_path, output_path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def _read_to_bytes(file_path: str) -> bytes:
+    """Parse a single PDF and return it re-serialized (runs in a worker process)."""
+    writer = PdfWriter()
+    with _open_mmap(file_path, will_need=True) as mapped:
+        # append() clones all pages through one shared object-id map
+        # instead of a separate add_page() traversal per page
+        writer.append(PdfReader(mapped))
+        buffer = io.BytesIO()
+        writer.write(buffer)
+    return buffer.getvalue()
+
+
+@dataclass(frozen=True)
+class PDFInfo:
+    """Basic information extracted from a PDF file."""
+    pages: int
+    title: str
+    author: str
+    file_size: int
+
+
+class _InfoCache:
+    """Persistent PDFInfo store keyed by absolute path, mtime and size."""
+    
+    def __init__(self, path: str):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=5, isolation_level=None,
+                                     check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS pdf_info ('
+            'path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, '
+            'pages INTEGER, title TEXT, author TEXT, stored_at REAL)'
+        )
+        self._conn.execute('DELETE FROM pdf_info WHERE stored_at < ?',
+                           (time.time() - INFO_CACHE_MAX_AGE,))
+        
+    def get(self, path: str, mtime_ns: int, size: int) -> Optional[PDFInfo]:
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT pages, title, author FROM pdf_info '
+                'WHERE path = ? AND mtime_ns = ? AND size = ?',
+                (path, mtime_ns, size)
+            ).fetchone()
+        if row is None:
+            return None
+        return PDFInfo(pages=row[0], title=row[1], author=row[2], file_size=size)
+    
+    def put(self, path: str, mtime_ns: int, info: PDFInfo):
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO pdf_info VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (path, mtime_ns, info.file_size, info.pages, info.title,
+                 info.author, time.time())
+            )
+    
+    def delete(self, path: str):
+        with self._lock:
+            self._conn.execute('DELETE FROM pdf_info WHERE path = ?', (path,))
+
+
+_info_cache: Optional[_InfoCache] = None
+_info_cache_pid: Optional[int] = None
+
+
+def _get_info_cache() -> Optional[_InfoCache]:
+    """Return this process's persistent info cache, or None if it can't be used."""
+    global _info_cache, _info_cache_pid
+    # SQLite connections must not be shared with forked worker processes
+    if _info_cache_pid != os.getpid():
+        _info_cache_pid = os.getpid()
+        try:
+            _info_cache = _InfoCache(INFO_CACHE_PATH)
+        except (sqlite3.Error, OSError) as e:
+            logging.getLogger(__name__).warning(
+                f"PDF info cache disabled ({INFO_CACHE_PATH}): {str(e)}")
+            _info_cache = None
+    return _info_cache
+
+
+def _read_info(file_path: str, size: int) -> PDFInfo:
+    """Parse a PDF and extract its basic information; raises if it is unreadable."""
+    with _open_mmap(file_path) as mapped:
+        # Reject non-PDFs from the header alone, before a full xref parse
+        if mapped.find(PDF_HEADER, 0, PDF_HEADER_SEARCH_LIMIT) == -1:
+            raise PdfReadError("Missing %PDF- header")
+        
+        reader = PdfReader(mapped)
+        # Try to access the first page to ensure the PDF is readable
+        if len(reader.pages) > 0:
+            _ = reader.pages[0]
+        metadata = reader.metadata
+        return PDFInfo(
+            pages=len(reader.pages),
+            title=(metadata.title if metadata else None) or '',
+            author=(metadata.author if metadata else None) or '',
+            file_size=size
+        )
+
+
+@lru_cache(maxsize=4096)
+def _parse(file_path: str, mtime_ns: int, size: int) -> PDFInfo:
+    """
+    Return basic information for a PDF.
+    
+    Results are cached in memory and on disk per (path, mtime, size), so a
+    file is only parsed again once it changes. Raises if the file is not a
+    readable PDF.
+    """
+    cache = _get_info_cache()
+    cache_path = os.path.abspath(file_path)
+    
+    if cache is not None:
+        try:
+            info = cache.get(cache_path, mtime_ns, size)
+            if info is not None:
+                return info
+        except sqlite3.Error:
+            pass  # Treat an unreadable cache as a miss
+    
+    info = _read_info(file_path, size)
+    
+    if cache is not None:
+        try:
+            cache.put(cache_path, mtime_ns, info)
+        except sqlite3.Error:
+            pass  # Caching is best-effort
+    return info
+
+
+def probe_pdf_file(file_path: str) -> Optional[dict]:
+    """
+    Validate a PDF and return its basic information from a single parse.
+    
+    A module-level function so it can run in a process pool. Returns None
+    if the file is not a readable PDF.
+    """
+    try:
+        stat = os.stat(file_path)
+        return asdict(_parse(file_path, stat.st_mtime_ns, stat.st_size))
+    except Exception:
+        return None
 
 
 class PDFMergerCore:
@@ -12,30 +305,60 @@ class PDFMergerCore:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         
-    def validate_pdf_file(self, file_path: str) -> bool:
-        """Validate if a file is a readable PDF."""
+    def _stat(self, file_path: str,
+              stats: Optional[Dict[str, os.stat_result]] = None) -> os.stat_result:
+        """
+        Return the stat result for a file.
+        
+        stats holds the results already taken for one command, such as a CLI
+        run or a single merge_pdfs call, so each file is only queried once.
+        """
+        if stats is None:
+            return os.stat(file_path)
+        stat = stats.get(file_path)
+        if stat is None:
+            stat = stats[file_path] = os.stat(file_path)
+        return stat
+        
+    def forget_file(self, file_path: str):
+        """
+        Drop the persisted info for a deleted file, rather than leaving it
+        until it ages out.
+        """
+        cache = _get_info_cache()
+        if cache is not None:
+            try:
+                cache.delete(os.path.abspath(file_path))
+            except sqlite3.Error:
+                pass  # Stale rows still expire after INFO_CACHE_MAX_AGE
+        
+    def _load_info(self, file_path: str,
+                   stats: Optional[Dict[str, os.stat_result]] = None) -> PDFInfo:
+        """Return cached information for a PDF, parsing it if it changed."""
+        stat = self._stat(file_path, stats)
+        try:
+            return _parse(file_path, stat.st_mtime_ns, stat.st_size)
+        except Exception:
+            # The file may be mid-write; stat it afresh on the next lookup
+            if stats is not None:
+                stats.pop(file_path, None)
+            raise
+        
+    def validate_pdf_file(self, file_path: str,
+                          stats: Optional[Dict[str, os.stat_result]] = None) -> bool:
+        """Validate if a file is a readable PDF, reusing stat results from stats."""
         try:
-            with open(file_path, 'rb') as file:
-                reader = PdfReader(file)
-                # Try to access the first page to ensure the PDF is readable
-                if len(reader.pages) > 0:
-                    _ = reader.pages[0]
-                return True
+            self._load_info(file_path, stats)
+            return True
         except (PdfReadError, FileNotFoundError, PermissionError, Exception) as e:
             self.logger.error(f"Invalid PDF file {file_path}: {str(e)}")
             return False
     
-    def get_pdf_info(self, file_path: str) -> dict:
-        """Get basic information about a PDF file."""
+    def get_pdf_info(self, file_path: str,
+                     stats: Optional[Dict[str, os.stat_result]] = None) -> dict:
+        """Get basic information about a PDF file, reusing stat results from stats."""
         try:
-            with open(file_path, 'rb') as file:
-                reader = PdfReader(file)
-                return {
-                    'pages': len(reader.pages),
-                    'title': reader.metadata.get('/Title', ''),
-                    'author': reader.metadata.get('/Author', ''),
-                    'file_size': os.path.getsize(file_path)
-                }
+            return asdict(self._load_info(file_path, stats))
         except Exception as e:
             self.logger.error(f"Could not get info for {file_path}: {str(e)}")
             return {'pages': 0, 'title': '', 'author': '', 'file_size': 0}
@@ -43,14 +366,27 @@ class PDFMergerCore:
     def merge_pdfs(self, 
                    input_files: List[str], 
                    output_path: str,
-                   progress_callback: Optional[Callable[[int, int], None]] = None) -> bool:
+                   progress_callback: Optional[Callable[[int, int], None]] = None,
+                   max_workers: Optional[int] = None,
+                   presumed_valid: bool = False,
+                   stats: Optional[Dict[str, os.stat_result]] = None) -> bool:
         """
         Merge multiple PDF files into a single output file.
         
+        Pages are copied with pikepdf (QPDF) when it is installed. Otherwise
+        input files are parsed with PyPDF2 in parallel worker processes and
+        appended to the output in their original order. A single input file
+        is copied to the output unchanged.
+        
         Args:
             input_files: List of input PDF file paths
             output_path: Path for the output merged PDF
             progress_callback: Optional callback function for progress updates
+            max_workers: Number of PyPDF2 worker processes (defaults to CPU count)
+            presumed_valid: Skip validation when the caller has already validated
+                the input files
+            stats: Stat results by path to reuse and add to, shared with the
+                caller's other lookups for the same command
             
         Returns:
             bool: True if successful, False otherwise
@@ -59,69 +395,234 @@ class PDFMergerCore:
             self.logger.error("No input files provided")
             return False
             
-        # Validate all input files first
-        valid_files = []
-        for file_path in input_files:
-            if not os.path.exists(file_path):
-                self.logger.error(f"File not found: {file_path}")
-                continue
-            if not self.validate_pdf_file(file_path):
-                self.logger.error(f"Invalid PDF file: {file_path}")
-                continue
-            valid_files.append(file_path)
+        # Without a caller's stats, results are kept for this merge only
+        if stats is None:
+            stats = {}
+        
+        # Validate all input files first, unless the caller already did
+        if presumed_valid:
+            valid_files = list(input_files)
+        else:
+            valid_files = []
+            for file_path in input_files:
+                try:
+                    self._stat(file_path, stats)
+                except OSError:
+                    self.logger.error(f"File not found: {file_path}")
+                    continue
+                if not self.validate_pdf_file(file_path, stats):
+                    self.logger.error(f"Invalid PDF file: {file_path}")
+                    continue
+                valid_files.append(file_path)
         
         if not valid_files:
             self.logger.error("No valid PDF files to merge")
             return False
         
         try:
-            writer = PdfWriter()
-            total_files = len(valid_files)
+            # Ensure output directory exists
+            output_dir = os.path.dirname(output_path)
+            if output_dir and not os.path.exists(output_dir):
+                os.makedirs(output_dir)
             
-            for i, file_path in enumerate(valid_files):
-                self.logger.info(f"Processing file {i+1}/{total_files}: {file_path}")
+            if len(valid_files) == 1:
+                self._copy_single_file(valid_files[0], output_path, progress_callback)
+            elif PIKEPDF_AVAILABLE:
+                self._merge_with_pikepdf(valid_files, output_path, progress_callback,
+                                         stats)
+            else:
+                self._merge_with_pypdf2(valid_files, output_path, progress_callback,
+                                        max_workers, stats)
+            
+            self.logger.info(f"Successfully merged {len(valid_files)} files into {output_path}")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Error during merge operation: {str(e)}")
+            return False
+    
+    def _copy_single_file(self,
+                          file_path: str,
+                          output_path: str,
+                          progress_callback: Optional[Callable[[int, int], None]]):
+        """Produce a one-file "merge" by copying the input byte for byte."""
+        self.logger.info(f"Processing file 1/1: {file_path}")
+        
+        # copyfile() uses the kernel's zero-copy path (sendfile/fcopyfile)
+        # where available, instead of a parse and re-serialize round trip
+        with _replace_when_done(output_path) as temp_path:
+            shutil.copyfile(file_path, temp_path)
+        
+        if progress_callback:
+            progress_callback(1, 1)
+    
+    def _merge_with_pikepdf(self,
+                            valid_files: List[str],
+                            output_path: str,
+                            progress_callback: Optional[Callable[[int, int], None]],
+                            stats: Dict[str, os.stat_result]):
+        """
+        Merge files with pikepdf, letting QPDF copy the page objects natively.
+        
+        Every source stays open until the output is saved. When there are more
+        inputs than OPEN_SOURCE_LIMIT allows, they are merged in batches
+        into intermediate files, which are then merged in turn.
+        """
+        total_files = len(valid_files)
+        batch_size = OPEN_SOURCE_LIMIT
+        
+        if total_files <= batch_size:
+            self._merge_pikepdf_batch(valid_files, output_path, progress_callback,
+                                      0, total_files, stats)
+            return
+        
+        with tempfile.TemporaryDirectory(prefix='pdf_merger_') as temp_dir:
+            parts = []
+            for start in range(0, total_files, batch_size):
+                part_path = os.path.join(temp_dir, f"part_{len(parts)}.pdf")
+                self._merge_pikepdf_batch(valid_files[start:start + batch_size],
+                                          part_path, progress_callback,
+                                          start, total_files, stats)
+                parts.append(part_path)
+            
+            self.logger.info(f"Combining {len(parts)} intermediate files")
+            self._merge_with_pikepdf(parts, output_path, None, stats)
+    
+    def _merge_pikepdf_batch(self,
+                             batch_files: List[str],
+                             output_path: str,
+                             progress_callback: Optional[Callable[[int, int], None]],
+                             done: int,
+                             total_files: int,
+                             stats: Dict[str, os.stat_result]):
+        """Merge one batch of files with pikepdf; done files precede it in the whole merge."""
+        # Sources must stay open until the output is saved, since QPDF copies
+        # their stream data lazily at save time.
+        with _reserve_sources(len(batch_files)), ExitStack() as stack:
+            output = pikepdf.Pdf.new()
+            
+            for i, file_path in enumerate(batch_files, start=done + 1):
+                self.logger.info(f"Processing file {i}/{total_files}: {file_path}")
+                
+                # Read the next file from disk while this one is being copied
+                if i - done < len(batch_files):
+                    _prefetch(batch_files[i - done])
                 
                 try:
-                    with open(file_path, 'rb') as file:
-                        reader = PdfReader(file)
-                        for page in reader.pages:
-                            writer.add_page(page)
+                    source = stack.enter_context(pikepdf.open(file_path))
+                    output.pages.extend(source.pages)
                     
                     if progress_callback:
-                        progress_callback(i + 1, total_files)
+                        progress_callback(i, total_files)
                         
+                except OSError as e:
+                    # Callers have already validated their inputs and wouldn't
+                    # learn of a skipped file, so fail the merge instead
+                    self.logger.error(f"Could not open {file_path}: {str(e)}")
+                    raise
                 except Exception as e:
                     self.logger.error(f"Error processing {file_path}: {str(e)}")
                     continue
             
-            # Ensure output directory exists
-            output_dir = os.path.dirname(output_path)
-            if output_dir and not os.path.exists(output_dir):
-                os.makedirs(output_dir)
-            
             # Write the merged PDF
-            with open(output_path, 'wb') as output_file:
-                writer.write(output_file)
+            self._write_output(lambda stream: output.save(stream, linearize=False),
+                               output_path, batch_files, stats)
+    
+    def _merge_with_pypdf2(self,
+                           valid_files: List[str],
+                           output_path: str,
+                           progress_callback: Optional[Callable[[int, int], None]],
+                           max_workers: Optional[int],
+                           stats: Dict[str, os.stat_result]):
+        """Merge files with PyPDF2, parsing inputs in parallel worker processes."""
+        writer = PdfWriter()
+        total_files = len(valid_files)
+        
+        workers = min(max_workers or os.cpu_count() or 1, total_files)
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # Workers parse up to two files each ahead of this thread, which
+            # appends finished files in input order. Parsing overlaps appending
+            # while at most 2 * workers serialized files are held in memory.
+            # Queued files are prefetched into the page cache as they are
+            # submitted, so they are already in memory when a worker picks
+            # them up.
+            def submit(file_path: str):
+                _prefetch(file_path)
+                return file_path, executor.submit(_read_to_bytes, file_path)
             
-            self.logger.info(f"Successfully merged {len(valid_files)} files into {output_path}")
-            return True
+            upcoming = iter(valid_files)
+            pending = deque(submit(file_path)
+                            for file_path in islice(upcoming, 2 * workers))
             
-        except Exception as e:
-            self.logger.error(f"Error during merge operation: {str(e)}")
-            return False
+            for i in range(total_files):
+                file_path, future = pending.popleft()
+                for next_path in islice(upcoming, 1):
+                    pending.append(submit(next_path))
+                
+                self.logger.info(f"Processing file {i+1}/{total_files}: {file_path}")
+                
+                try:
+                    writer.append(io.BytesIO(future.result()))
+                    
+                    if progress_callback:
+                        progress_callback(i + 1, total_files)
+                        
+                except Exception as e:
+                    self.logger.error(f"Error processing {file_path}: {str(e)}")
+                    continue
+        
+        # Write the merged PDF
+        self._write_output(writer.write, output_path, valid_files, stats)
+    
+    def _write_output(self,
+                      save: Callable[[IO[bytes]], None],
+                      output_path: str,
+                      valid_files: List[str],
+                      stats: Dict[str, os.stat_result]):
+        """
+        Serialize the merged PDF to output_path.
+        
+        Small merges are rendered into memory and written with one call;
+        large ones stream to disk through a 1 MiB buffer to bound memory use.
+        Either way the output is written beside output_path and renamed into
+        place, so a failed merge never leaves a truncated file behind.
+        """
+        input_size = 0
+        for file_path in valid_files:
+            try:
+                input_size += self._stat(file_path, stats).st_size
+            except OSError:
+                pass  # Already logged and skipped by the merge loop
+        
+        with _replace_when_done(output_path) as temp_path:
+            if input_size < IN_MEMORY_OUTPUT_LIMIT:
+                buffer = io.BytesIO()
+                save(buffer)
+                with open(temp_path, 'wb') as output_file:
+                    output_file.write(buffer.getbuffer())
+            else:
+                with open(temp_path, 'wb', buffering=OUTPUT_BUFFER_SIZE) as output_file:
+                    save(output_file)
     
-    def get_file_list_info(self, file_paths: List[str]) -> dict:
-        """Get summary information about a list of PDF files."""
+    def get_file_list_info(self, file_paths: List[str],
+                           stats: Optional[Dict[str, os.stat_result]] = None) -> dict:
+        """Get summary information about a list of PDF files, reusing stat results from stats."""
         total_pages = 0
         total_size = 0
         valid_files = 0
         
+        # A single cached lookup per file yields both validity and stats
+        if stats is None:
+            stats = {}
         for file_path in file_paths:
-            if self.validate_pdf_file(file_path):
-                info = self.get_pdf_info(file_path)
-                total_pages += info['pages']
-                total_size += info['file_size']
-                valid_files += 1
+            try:
+                info = self._load_info(file_path, stats)
+            except Exception:
+                continue
+            total_pages += info.pages
+            total_size += info.file_size
+            valid_files += 1
         
         return {
             'total_files': len(file_paths),
@@ -132,12 +633,27 @@ class PDFMergerCore:
 
 
 def setup_logging(level=logging.INFO):
-    """Setup basic logging configuration."""
+    """
+    Setup basic logging configuration.
+    
+    Records are handed to a background listener thread, so logging never
+    blocks the caller on I/O. File output is batched in memory and flushed
+    every 1024 records, on errors, and at exit.
+    """
+    global _log_listener
+    if _log_listener is not None:
+        return
+    
+    log_queue = queue.Queue(-1)
+    file_handler = MemoryHandler(1024, flushLevel=logging.ERROR,
+                                 target=logging.FileHandler('pdf_merger.log'))
+    _log_listener = QueueListener(log_queue, logging.StreamHandler(), file_handler)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+    
+    # The QueueHandler formats each record before it is queued
     logging.basicConfig(
         level=level,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.StreamHandler(),
-            logging.FileHandler('pdf_merger.log')
-        ]
-    )
\ No newline at end of file
+        handlers=[QueueHandler(log_queue)]
+    )
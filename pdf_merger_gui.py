@@ -3,6 +3,9 @@ from tkinter import ttk, filedialog, messagebox
 import os
 from pathlib import Path
 import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 try:
     from tkinterdnd2 import DND_FILES, TkinterDnD
@@ -12,6 +15,9 @@ except ImportError:
     
 from pdf_merger_core import PDFMergerCore, setup_logging
 
+# Minimum time between progress bar redraws during a merge, in seconds
+PROGRESS_UPDATE_INTERVAL = 0.05
+
 
 class PDFMergerGUI:
     """GUI application for PDF merging with drag-and-drop support."""
@@ -31,8 +37,17 @@ class PDFMergerGUI:
         self.merger = PDFMergerCore()
         setup_logging()
         
-        # File list storage
+        # File list storage, with running totals for the status bar
         self.file_paths = []
+        self._file_info = {}
+        self._total_pages = 0
+        self._total_bytes = 0
+        
+        # Dropped files are validated on a thread pool so the UI stays responsive;
+        # results are applied on the Tk thread in the order files were given
+        self._io_pool = ThreadPoolExecutor(max_workers=8)
+        self._pending_probes = deque()
+        self._pending_paths = set()
         
         # Create GUI elements
         self.create_widgets()
@@ -162,7 +177,7 @@ class PDFMergerGUI:
     def on_drop(self, event):
         """Handle drag and drop events."""
         files = self.root.tk.splitlist(event.data)
-        pdf_files = [f for f in files if f.lower().endswith('.pdf')]
+        pdf_files = [f for f in files if os.path.splitext(f)[1].lower() == '.pdf']
         if pdf_files:
             self.add_files_to_list(pdf_files)
             
@@ -176,28 +191,52 @@ class PDFMergerGUI:
             self.add_files_to_list(files)
             
     def add_files_to_list(self, files: List[str]):
-        """Add files to the file list with validation."""
-        added_count = 0
+        """Queue files for validation; valid ones are added to the list as they finish."""
         for file_path in files:
-            if file_path not in self.file_paths:
-                if self.merger.validate_pdf_file(file_path):
-                    self.file_paths.append(file_path)
-                    info = self.merger.get_pdf_info(file_path)
-                    
-                    # Add to treeview
-                    filename = os.path.basename(file_path)
-                    size_mb = info['file_size'] / (1024 * 1024)
-                    
-                    self.file_tree.insert('', tk.END, text=filename,
-                                        values=(info['pages'], f"{size_mb:.1f} MB"))
-                    added_count += 1
-                else:
-                    messagebox.showerror("Invalid File", 
-                                       f"Cannot read PDF file:\n{file_path}")
+            # _file_info is keyed by every listed path, so this is a dict lookup
+            # rather than a scan of file_paths
+            if file_path in self._file_info or file_path in self._pending_paths:
+                continue
+            self._pending_paths.add(file_path)
+            future = self._io_pool.submit(self._probe, file_path)
+            self._pending_probes.append(future)
+            future.add_done_callback(lambda _: self.root.after(0, self._on_probe))
+        self.update_merge_button_state()
+            
+    def _probe(self, file_path: str):
+        """Validate a file and read its info (runs on the I/O thread pool)."""
+        if not self.merger.validate_pdf_file(file_path):
+            return file_path, False, None
+        return file_path, True, self.merger.get_pdf_info(file_path)
+        
+    def _on_probe(self):
+        """Add finished probes to the file list, preserving the original order."""
+        added_count = 0
+        while self._pending_probes and self._pending_probes[0].done():
+            file_path, ok, info = self._pending_probes.popleft().result()
+            self._pending_paths.discard(file_path)
+            
+            if ok:
+                self.file_paths.append(file_path)
+                self._file_info[file_path] = info
+                self._total_pages += info['pages']
+                self._total_bytes += info['file_size']
+                
+                # Add to treeview
+                filename = os.path.basename(file_path)
+                size_mb = info['file_size'] / (1024 * 1024)
+                
+                self.file_tree.insert('', tk.END, text=filename,
+                                    values=(info['pages'], f"{size_mb:.1f} MB"))
+                added_count += 1
+            else:
+                messagebox.showerror("Invalid File", 
+                                   f"Cannot read PDF file:\n{file_path}")
         
         if added_count > 0:
             self.update_status()
-            self.update_merge_button_state()
+        # Merging waits until every queued file has been checked
+        self.update_merge_button_state()
             
     def remove_selected(self):
         """Remove selected files from the list."""
@@ -214,7 +253,10 @@ class PDFMergerGUI:
             
         # Remove from file_paths and treeview (in reverse order to maintain indices)
         for index in sorted(indices_to_remove, reverse=True):
-            del self.file_paths[index]
+            file_path = self.file_paths.pop(index)
+            info = self._file_info.pop(file_path)
+            self._total_pages -= info['pages']
+            self._total_bytes -= info['file_size']
             
         for item in selection:
             self.file_tree.delete(item)
@@ -227,6 +269,11 @@ class PDFMergerGUI:
         if self.file_paths and messagebox.askyesno("Confirm Clear", 
                                                   "Remove all files from the list?"):
             self.file_paths.clear()
+            self._file_info.clear()
+            self._total_pages = 0
+            self._total_bytes = 0
+            self._pending_probes.clear()
+            self._pending_paths.clear()
             for item in self.file_tree.get_children():
                 self.file_tree.delete(item)
             self.update_status()
@@ -286,15 +333,17 @@ class PDFMergerGUI:
         if not self.file_paths:
             self.status_var.set("Add PDF files to begin")
         else:
-            info = self.merger.get_file_list_info(self.file_paths)
+            # Totals are kept up to date as files are added and removed,
+            # so refreshing the status bar doesn't rescan the whole list
             self.status_var.set(
-                f"{info['valid_files']} files, {info['total_pages']} pages, "
-                f"{info['total_size']/(1024*1024):.1f} MB total"
+                f"{len(self.file_paths)} files, {self._total_pages} pages, "
+                f"{self._total_bytes/(1024*1024):.1f} MB total"
             )
             
     def update_merge_button_state(self):
         """Enable/disable merge button based on current state."""
-        if self.file_paths and self.output_var.get().strip():
+        if (self.file_paths and self.output_var.get().strip()
+                and not self._pending_probes):
             self.merge_button.config(state=tk.NORMAL)
         else:
             self.merge_button.config(state=tk.DISABLED)
@@ -304,6 +353,11 @@ class PDFMergerGUI:
         if not self.file_paths:
             messagebox.showwarning("No Files", "Please add PDF files to merge.")
             return
+        
+        if self._pending_probes:
+            messagebox.showwarning("Files Loading",
+                                   "Please wait until all added files have been checked.")
+            return
             
         output_path = self.output_var.get().strip()
         if not output_path:
@@ -323,20 +377,31 @@ class PDFMergerGUI:
         
     def merge_pdfs_thread(self, file_paths: List[str], output_path: str):
         """Thread function for PDF merging."""
+        last_update = 0.0
+        
         def progress_callback(current: int, total: int):
+            nonlocal last_update
+            # Redraw at most every 50 ms, but always show the final file
+            now = time.monotonic()
+            if current < total and now - last_update < PROGRESS_UPDATE_INTERVAL:
+                return
+            last_update = now
+            
             progress = (current / total) * 100
             self.root.after(0, lambda: self.progress_bar.config(value=progress))
             self.root.after(0, lambda: self.progress_var.set(
                 f"Processing file {current}/{total}..."))
             
-        success = self.merger.merge_pdfs(file_paths, output_path, progress_callback)
+        # Files were validated when they were added to the list
+        success = self.merger.merge_pdfs(file_paths, output_path, progress_callback,
+                                         presumed_valid=True)
         
         # Update UI on main thread
         self.root.after(0, lambda: self.merge_complete(success, output_path))
         
     def merge_complete(self, success: bool, output_path: str):
         """Handle merge completion."""
-        self.merge_button.config(state=tk.NORMAL)
+        self.update_merge_button_state()
         self.progress_bar['value'] = 100 if success else 0
         
         if success:
@@ -351,6 +416,7 @@ class PDFMergerGUI:
     def run(self):
         """Start the GUI application."""
         self.root.mainloop()
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
 
 
 def main():
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Job storage for the PDF merger web application.
+Keeps merge job state in SQLite so every server worker process sees the same jobs.
+"""
+
+import os
+import json
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+# Job record fields, in column order
+JOB_FIELDS = ('id', 'status', 'progress', 'created_at', 'created_at_ts',
+              'uploaded_files', 'file_info', 'output_filename', 'output_path',
+              'error')
+
+# Fields holding lists, stored as JSON text
+JSON_FIELDS = ('uploaded_files', 'file_info')
+
+
+class JobStore:
+    """Merge job records keyed by job id, stored in a WAL-mode SQLite database."""
+    
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+    
+    def _connection(self) -> sqlite3.Connection:
+        """Return this process's connection, opening it on first use."""
+        # SQLite connections must not be shared with forked worker processes
+        if self._pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None,
+                                   check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS jobs ('
+                'id TEXT PRIMARY KEY, status TEXT NOT NULL, '
+                'progress INTEGER NOT NULL, created_at TEXT NOT NULL, '
+                'created_at_ts REAL NOT NULL, '
+                'uploaded_files TEXT NOT NULL, file_info TEXT NOT NULL, '
+                'output_filename TEXT, output_path TEXT, error TEXT)'
+            )
+            conn.execute('CREATE INDEX IF NOT EXISTS jobs_created_at_ts ON jobs (created_at_ts)')
+            self._conn, self._pid = conn, os.getpid()
+        return self._conn
+    
+    @contextmanager
+    def transaction(self):
+        """
+        Hold the store exclusively for a read-modify-write.
+        
+        Other threads wait on the lock and other processes on SQLite's write
+        lock. Nested calls join the outer transaction.
+        """
+        with self._lock:
+            conn = self._connection()
+            if conn.in_transaction:
+                yield
+                return
+            
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                yield
+            except BaseException:
+                conn.execute('ROLLBACK')
+                raise
+            conn.execute('COMMIT')
+    
+    def _to_job(self, row: sqlite3.Row) -> Dict:
+        job = dict(row)
+        for field in JSON_FIELDS:
+            job[field] = json.loads(job[field])
+        return job
+    
+    def _to_columns(self, fields: Dict) -> Dict:
+        unknown = set(fields) - set(JOB_FIELDS)
+        if unknown:
+            raise KeyError(f"Unknown job fields: {', '.join(sorted(unknown))}")
+        return {
+            name: json.dumps(value) if name in JSON_FIELDS else value
+            for name, value in fields.items()
+        }
+    
+    def insert(self, job: Dict):
+        """Store a new job record."""
+        columns = self._to_columns(job)
+        with self._lock:
+            self._connection().execute(
+                f"INSERT INTO jobs ({', '.join(columns)}) "
+                f"VALUES ({', '.join('?' * len(columns))})",
+                tuple(columns.values())
+            )
+    
+    def get(self, job_id: str) -> Optional[Dict]:
+        """Return a job record, or None if there is no such job."""
+        with self._lock:
+            row = self._connection().execute(
+                'SELECT * FROM jobs WHERE id = ?', (job_id,)
+            ).fetchone()
+        return self._to_job(row) if row else None
+    
+    def update(self, job_id: str, expected_status: Optional[str] = None, **fields) -> bool:
+        """
+        Set fields on a job.
+        
+        Args:
+            job_id: Job to update
+            expected_status: Only update if the job currently has this status
+            **fields: Field values to store
+        
+        Returns:
+            True if the job was updated, False if it is gone or its status differed
+        """
+        columns = self._to_columns(fields)
+        query = f"UPDATE jobs SET {', '.join(f'{name} = ?' for name in columns)} WHERE id = ?"
+        params = list(columns.values()) + [job_id]
+        if expected_status is not None:
+            query += ' AND status = ?'
+            params.append(expected_status)
+        
+        with self._lock:
+            cursor = self._connection().execute(query, params)
+        return cursor.rowcount == 1
+    
+    def file_in_use(self, file_path: str) -> bool:
+        """Return whether any stored job lists file_path among its uploads."""
+        with self._lock:
+            row = self._connection().execute(
+                'SELECT 1 FROM jobs, json_each(jobs.uploaded_files) '
+                'WHERE json_each.value = ? LIMIT 1', (file_path,)
+            ).fetchone()
+        return row is not None
+    
+    def delete(self, job_id: str) -> Optional[Dict]:
+        """Remove a job and return its last record, or None if there is no such job."""
+        with self.transaction():
+            job = self.get(job_id)
+            if job is not None:
+                self._connection().execute('DELETE FROM jobs WHERE id = ?', (job_id,))
+        return job
+    
+    def pop_expired(self, created_before: float) -> List[Dict]:
+        """Remove and return every job created before the given Unix time."""
+        with self.transaction():
+            conn = self._connection()
+            rows = conn.execute(
+                'SELECT * FROM jobs WHERE created_at_ts < ?', (created_before,)
+            ).fetchall()
+            conn.execute('DELETE FROM jobs WHERE created_at_ts < ?', (created_before,))
+        return [self._to_job(row) for row in rows]
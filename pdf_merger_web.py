@@ -5,32 +5,141 @@ Provides a browser-based interface for the PDF merger tool.
 """
 
 import os
-import json
 import uuid
+import time
+import hashlib
+import logging
 import tempfile
 import threading
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List
+from urllib.parse import quote, unquote
 
-from flask import Flask, render_template, request, jsonify, send_file, url_for
+from flask import Flask, Request, Response, render_template, request, jsonify, send_file, url_for
+from flask.json.provider import DefaultJSONProvider
 from werkzeug.utils import secure_filename
 from werkzeug.exceptions import RequestEntityTooLarge
+from werkzeug.wsgi import get_input_stream
+
+from pdf_merger_core import (PDFMergerCore, PDF_HEADER, PDF_HEADER_SEARCH_LIMIT,
+                             probe_pdf_file, setup_logging)
+from pdf_merger_jobs import JobStore
+
+# Optional fast JSON encoding
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider that encodes with orjson; types it can't handle go through Flask's default."""
+    
+    option = orjson.OPT_NON_STR_KEYS if ORJSON_AVAILABLE else 0
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=self.option).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        # orjson already produces bytes, so skip the round trip through str
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=self.option),
+            mimetype=self.mimetype
+        )
+
+
+class UploadRequest(Request):
+    """Request that keeps little of each multipart file part in memory."""
+    
+    # Werkzeug keeps up to 500 KB of every file part in memory
+    FILE_SPOOL_SIZE = 64 * 1024
+    
+    def _get_file_stream(self, total_content_length, content_type,
+                         filename=None, content_length=None):
+        # Larger parts roll over to an unlinked file in the upload folder
+        return tempfile.SpooledTemporaryFile(max_size=self.FILE_SPOOL_SIZE,
+                                             dir=app.config['UPLOAD_FOLDER'])
 
-from pdf_merger_core import PDFMergerCore, setup_logging
 
 # Configure Flask app
 app = Flask(__name__)
+app.request_class = UploadRequest
+if ORJSON_AVAILABLE:
+    app.json = ORJSONProvider(app)
 app.config['MAX_CONTENT_LENGTH'] = 100 * 1024 * 1024  # 100MB max file size
-app.config['UPLOAD_FOLDER'] = tempfile.mkdtemp(prefix='pdf_merger_')
+app.config['MAX_STREAM_CONTENT_LENGTH'] = 1024 * 1024 * 1024  # 1GB max streamed file
+# Set PDF_MERGER_UPLOAD_FOLDER when running several worker processes so they
+# share uploads and the job database
+app.config['UPLOAD_FOLDER'] = (os.environ.get('PDF_MERGER_UPLOAD_FOLDER')
+                               or tempfile.mkdtemp(prefix='pdf_merger_'))
+os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
+app.config['JOB_DATABASE'] = os.path.join(app.config['UPLOAD_FOLDER'], 'jobs.sqlite3')
 app.config['SECRET_KEY'] = 'pdf-merger-secret-key-change-in-production'
 
+# Hand downloads to the front proxy instead of streaming them from a worker:
+# PDF_MERGER_X_SENDFILE=1 for Apache mod_xsendfile (or lighttpd), or
+# PDF_MERGER_ACCEL_REDIRECT=/protected/ for an nginx internal location that
+# aliases the upload folder
+app.config['USE_X_SENDFILE'] = os.environ.get('PDF_MERGER_X_SENDFILE') == '1'
+app.config['X_ACCEL_REDIRECT_PREFIX'] = os.environ.get('PDF_MERGER_ACCEL_REDIRECT')
+
 # Global storage for merge jobs
-merge_jobs: Dict[str, dict] = {}
+job_store = JobStore(app.config['JOB_DATABASE'])
 merger = PDFMergerCore()
 
+# Merges queued or running in this process, so they can be cancelled
+merge_futures: Dict[str, Future] = {}
+
+# Set PDF_MERGER_WEB_WORKERS to the number of server processes so each one
+# sizes its pools to its share of the CPUs rather than to the whole machine
+WEB_WORKERS = max(1, int(os.environ.get('PDF_MERGER_WEB_WORKERS', '1')))
+CPU_SHARE = max(1, (os.cpu_count() or 1) // WEB_WORKERS)
+
+# Merges share one bounded pool instead of spawning a thread per job
+MERGE_THREADS = int(os.environ.get('PDF_MERGER_MERGE_THREADS', min(8, CPU_SHARE)))
+merge_executor = ThreadPoolExecutor(max_workers=MERGE_THREADS,
+                                    thread_name_prefix='pdf_merge')
+
+# Parsing uploads is CPU-bound, so batches are validated across processes;
+# with a single process to spare they are probed in the request thread
+VALIDATE_PROCESSES = int(os.environ.get('PDF_MERGER_VALIDATE_PROCESSES', CPU_SHARE))
+validate_pool = (ProcessPoolExecutor(max_workers=VALIDATE_PROCESSES)
+                 if VALIDATE_PROCESSES > 1 else None)
+validate_pool_lock = threading.Lock()
+
+# Upper bound on files in one job, for both uploads and reorders
+MAX_FILES_PER_JOB = 200
+
+# Chunk size used when streaming request bodies to disk
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+# Seconds between background sweeps for expired jobs
+CLEANUP_INTERVAL = 300
+
+# Seconds an event stream waits for a change before re-reading its job; this
+# also bounds the delay for merges running in other worker processes
+EVENT_WAIT_TIMEOUT = 2
+
+# Counter bumped whenever this process changes a job, so event streams can
+# wait for it instead of polling
+job_changes = threading.Condition()
+job_change_count = 0
+
+# Process that owns the running cleanup timer
+cleanup_pid = None
+cleanup_lock = threading.Lock()
+
 # Setup logging
 setup_logging()
+logger = logging.getLogger(__name__)
 
 def allowed_file(filename):
     """Check if file has allowed extension."""
@@ -38,41 +147,230 @@ def allowed_file(filename):
 
 def cleanup_old_files():
     """Clean up old uploaded files and completed jobs."""
-    current_time = datetime.now()
-    to_remove = []
-    
-    for job_id, job_data in merge_jobs.items():
-        job_time = datetime.fromisoformat(job_data['created_at'])
-        # Remove jobs older than 1 hour
-        if (current_time - job_time).total_seconds() > 3600:
-            to_remove.append(job_id)
-            # Clean up files
-            for file_path in job_data.get('uploaded_files', []):
-                try:
-                    if os.path.exists(file_path):
-                        os.remove(file_path)
-                except:
-                    pass
-            # Clean up output file
-            output_path = job_data.get('output_path')
-            if output_path and os.path.exists(output_path):
-                try:
-                    os.remove(output_path)
-                except:
-                    pass
-    
-    for job_id in to_remove:
-        del merge_jobs[job_id]
+    # Remove jobs older than 1 hour
+    expired = job_store.pop_expired(time.time() - 3600)
+    
+    # Delete files once the jobs are gone from the store
+    for job_data in expired:
+        future = merge_futures.pop(job_data['id'], None)
+        if future:
+            future.cancel()
+        remove_job_files(job_data)
+
+def remove_job_files(job):
+    """Delete a job's uploads and output, and forget their cached PDF info."""
+    # Clean up files
+    for file_path in job.get('uploaded_files', []):
+        release_upload(file_path)
+    
+    # Clean up output file
+    output_path = job.get('output_path')
+    if output_path:
+        remove_file(output_path)
+
+def remove_file(file_path):
+    """Delete a file if it is still there, without a separate exists() check."""
+    try:
+        os.unlink(file_path)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning(f"Could not remove {file_path}: {str(e)}")
+
+def release_upload(file_path):
+    """Delete a stored upload unless another job still uses the same content."""
+    # Uploads are placed within a transaction too, so a file can't be deleted
+    # between a new job's check for it and that job being recorded
+    with job_store.transaction():
+        if job_store.file_in_use(file_path):
+            return
+        remove_file(file_path)
+    merger.forget_file(file_path)
+
+def save_upload(stream, head=b''):
+    """
+    Write an upload to the upload folder, named by its SHA-256 digest.
+    
+    head is data already read from the stream, written ahead of the rest.
+    
+    The digest is computed while writing, so identical content maps to one
+    stored file. If that file already exists it is left alone and keeps its
+    mtime, so its cached PDF info is reused.
+    
+    The new copy is kept as a spare until place_upload, in case the stored
+    file is released by another job in the meantime.
+    
+    Returns:
+        Tuple of the stored file's path and the spare copy's path
+    """
+    digest = hashlib.sha256()
+    fd, temp_path = tempfile.mkstemp(suffix='.part', dir=app.config['UPLOAD_FOLDER'])
+    try:
+        with os.fdopen(fd, 'wb') as output_file:
+            digest.update(head)
+            output_file.write(head)
+            for chunk in iter(lambda: stream.read(STREAM_CHUNK_SIZE), b''):
+                digest.update(chunk)
+                output_file.write(chunk)
+    except Exception:
+        # Don't leave a partial upload behind if the client goes away
+        os.remove(temp_path)
+        raise
+    
+    file_path = os.path.join(app.config['UPLOAD_FOLDER'], f"{digest.hexdigest()}.pdf")
+    try:
+        os.link(temp_path, file_path)
+    except FileExistsError:
+        pass
+    except Exception:
+        os.remove(temp_path)
+        raise
+    return file_path, temp_path
+
+def place_upload(file_path, spare_path):
+    """
+    Make sure a saved upload is still stored and drop its spare copy.
+    
+    Call within the job_store transaction that records the job using it.
+    """
+    if os.path.exists(file_path):
+        remove_file(spare_path)
+    else:
+        # Released since it was saved; the spare has the same content
+        os.replace(spare_path, file_path)
+
+def sweep_old_files():
+    """Run cleanup_old_files now and again every CLEANUP_INTERVAL seconds."""
+    try:
+        cleanup_old_files()
+    except Exception as e:
+        logger.error(f"Cleanup of old jobs failed: {str(e)}")
+    
+    timer = threading.Timer(CLEANUP_INTERVAL, sweep_old_files)
+    timer.daemon = True
+    timer.start()
+
+@app.before_request
+def start_cleanup_sweeper():
+    """Start the cleanup timer once per server process."""
+    global cleanup_pid
+    # Timer threads don't survive a fork, so forked workers start their own
+    if cleanup_pid != os.getpid():
+        with cleanup_lock:
+            if cleanup_pid != os.getpid():
+                cleanup_pid = os.getpid()
+                sweep_old_files()
+
+def notify_job_change():
+    """Wake the event streams waiting on job changes in this process."""
+    global job_change_count
+    with job_changes:
+        job_change_count += 1
+        job_changes.notify_all()
+
+def job_status(job):
+    """Status fields reported for a job by /status and /events."""
+    return {
+        'job_id': job['id'],
+        'status': job['status'],
+        'progress': job['progress'],
+        'error': job.get('error'),
+        'output_filename': job.get('output_filename'),
+        'file_count': len(job['uploaded_files']),
+        'created_at': job['created_at']
+    }
+
+def probe_uploads(file_paths):
+    """Run probe_pdf_file on saved uploads, in parallel when there are several."""
+    global validate_pool
+    pool = validate_pool
+    if len(file_paths) < 2 or pool is None:
+        return [probe_pdf_file(file_path) for file_path in file_paths]
+    
+    try:
+        return list(pool.map(probe_pdf_file, file_paths))
+    except BrokenProcessPool:
+        # A pool process died (e.g. killed for memory); replace the pool for
+        # later uploads and probe this batch here
+        logger.warning("Upload validation pool broke; starting a new one")
+        with validate_pool_lock:
+            if validate_pool is pool:
+                validate_pool = ProcessPoolExecutor(max_workers=VALIDATE_PROCESSES)
+        pool.shutdown(wait=False)
+        return [probe_pdf_file(file_path) for file_path in file_paths]
+
+def inspect_upload(file_path, original_filename, info):
+    """Describe a probed upload; invalid files are deleted."""
+    if info is not None:
+        return {
+            'filename': original_filename,  # Original filename
+            'path': file_path,
+            'pages': info['pages'],
+            'size': info['file_size'],
+            'title': info.get('title', ''),
+            'valid': True
+        }
+    
+    # Remove invalid file
+    remove_file(file_path)
+    return invalid_upload(original_filename, 'Invalid PDF file')
+
+def invalid_upload(original_filename, error):
+    """Describe a rejected upload."""
+    logger.warning(f"Rejected upload {original_filename}: {error}")
+    return {
+        'filename': original_filename,
+        'path': None,
+        'pages': 0,
+        'size': 0,
+        'title': '',
+        'valid': False,
+        'error': error
+    }
+
+def read_head(stream):
+    """Read the start of an upload, enough to look for the %PDF- header."""
+    head = b''
+    while len(head) < PDF_HEADER_SEARCH_LIMIT:
+        chunk = stream.read(PDF_HEADER_SEARCH_LIMIT - len(head))
+        if not chunk:
+            break
+        head += chunk
+    return head
+
+def create_job(job_id, uploaded_files, file_info):
+    """Build the stored record for a new upload job."""
+    created_at = time.time()
+    return {
+        'id': job_id,
+        'status': 'uploaded',
+        'uploaded_files': uploaded_files,
+        'file_info': file_info,
+        'created_at': datetime.fromtimestamp(created_at).isoformat(),  # For display
+        'created_at_ts': created_at,
+        'progress': 0,
+        'output_path': None,
+        'error': None
+    }
+
+def job_upload_summary(job):
+    """Response body describing the files of an upload job."""
+    return {
+        'job_id': job['id'],
+        'files': job['file_info'],
+        'valid_count': len(job['uploaded_files']),
+        'total_count': len(job['file_info'])
+    }
 
 @app.route('/')
 def index():
     """Main application page."""
-    cleanup_old_files()
     return render_template('index.html')
 
 @app.route('/upload', methods=['POST'])
 def upload_files():
     """Handle file uploads."""
+    spare_files = []
     try:
         if 'files' not in request.files:
             return jsonify({'error': 'No files uploaded'}), 400
@@ -81,79 +379,150 @@ def upload_files():
         if not files or all(f.filename == '' for f in files):
             return jsonify({'error': 'No files selected'}), 400
         
+        if len(files) > MAX_FILES_PER_JOB:
+            return jsonify({'error': f'Too many files. Maximum is {MAX_FILES_PER_JOB} per job.'}), 400
+        
         # Create new job
         job_id = str(uuid.uuid4())
-        uploaded_files = []
-        file_info = []
+        saved_files = []
+        original_filenames = []
+        rejected = {}
         
         for file in files:
+            # Stored files are named by content digest, so the client's
+            # filename is only kept for display and never reaches the disk
             if file and allowed_file(file.filename):
-                # Secure filename and save
-                filename = secure_filename(file.filename)
-                if not filename:
+                # Turn away anything without a PDF header before writing it
+                head = read_head(file.stream)
+                if PDF_HEADER not in head:
+                    rejected[len(original_filenames)] = invalid_upload(
+                        file.filename, 'Not a PDF file')
+                    original_filenames.append(file.filename)
+                    file.close()
                     continue
-                    
-                # Add timestamp to avoid conflicts
-                name, ext = os.path.splitext(filename)
-                filename = f"{name}_{int(datetime.now().timestamp())}{ext}"
                 
-                file_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-                file.save(file_path)
+                file_path, spare_path = save_upload(file.stream, head)
+                saved_files.append(file_path)
+                spare_files.append(spare_path)
+                original_filenames.append(file.filename)
                 
-                # Validate PDF
-                if merger.validate_pdf_file(file_path):
-                    info = merger.get_pdf_info(file_path)
-                    uploaded_files.append(file_path)
-                    file_info.append({
-                        'filename': file.filename,  # Original filename
-                        'path': file_path,
-                        'pages': info['pages'],
-                        'size': info['file_size'],
-                        'title': info.get('title', ''),
-                        'valid': True
-                    })
-                else:
-                    # Remove invalid file
-                    try:
-                        os.remove(file_path)
-                    except:
-                        pass
-                    file_info.append({
-                        'filename': file.filename,
-                        'path': None,
-                        'pages': 0,
-                        'size': 0,
-                        'title': '',
-                        'valid': False,
-                        'error': 'Invalid PDF file'
-                    })
+                # Release the spooled part now rather than when the request ends
+                file.close()
+        
+        # Validate everything at once, parsing each file only once
+        probes = iter(zip(saved_files, spare_files, probe_uploads(saved_files)))
+        file_info = []
+        for index, original_filename in enumerate(original_filenames):
+            if index in rejected:
+                file_info.append(rejected[index])
+            else:
+                file_path, spare_path, info = next(probes)
+                if info is None:
+                    # The stored file may have been released while probing
+                    info = probe_pdf_file(spare_path)
+                file_info.append(inspect_upload(file_path, original_filename, info))
+        uploaded_files = [entry['path'] for entry in file_info if entry['valid']]
         
         if not uploaded_files:
             return jsonify({'error': 'No valid PDF files uploaded'}), 400
         
         # Store job data
-        merge_jobs[job_id] = {
-            'id': job_id,
-            'status': 'uploaded',
-            'uploaded_files': uploaded_files,
-            'file_info': file_info,
-            'created_at': datetime.now().isoformat(),
-            'progress': 0,
-            'output_path': None,
-            'error': None
-        }
+        job = create_job(job_id, uploaded_files, file_info)
+        with job_store.transaction():
+            for file_path, spare_path in zip(saved_files, spare_files):
+                if file_path in uploaded_files:
+                    place_upload(file_path, spare_path)
+            job_store.insert(job)
         
-        return jsonify({
-            'job_id': job_id,
-            'files': file_info,
-            'valid_count': len(uploaded_files),
-            'total_count': len(file_info)
-        })
+        return jsonify(job_upload_summary(job))
         
     except RequestEntityTooLarge:
         return jsonify({'error': 'File too large. Maximum size is 100MB per request.'}), 413
     except Exception as e:
         return jsonify({'error': f'Upload failed: {str(e)}'}), 500
+    finally:
+        # Spares of rejected files, or of every file if the upload failed
+        for spare_path in spare_files:
+            remove_file(spare_path)
+
+@app.route('/upload_stream', methods=['POST'])
+def upload_stream():
+    """
+    Stream a single PDF upload straight to disk.
+    
+    The request body is the raw file and its URL-encoded name is sent in the
+    X-Filename header. Unlike /upload, nothing is buffered by multipart
+    parsing. Send X-Job-Id to add the file to an existing job.
+    """
+    spare_path = None
+    try:
+        original_filename = unquote(request.headers.get('X-Filename', ''))
+        if not allowed_file(original_filename):
+            return jsonify({'error': 'A .pdf filename is required in X-Filename'}), 400
+        
+        job_id = request.headers.get('X-Job-Id')
+        if job_id:
+            job = job_store.get(job_id)
+            if job is None:
+                return jsonify({'error': 'Job not found'}), 404
+            if job['status'] != 'uploaded':
+                return jsonify({'error': 'Cannot add files after merge started'}), 400
+            if len(job['file_info']) >= MAX_FILES_PER_JOB:
+                return jsonify({'error': f'Too many files. Maximum is {MAX_FILES_PER_JOB} per job.'}), 400
+        
+        # Read the WSGI input directly; request.stream would apply the
+        # multipart upload cap (MAX_CONTENT_LENGTH) instead of the stream one
+        stream = get_input_stream(
+            request.environ,
+            max_content_length=app.config['MAX_STREAM_CONTENT_LENGTH']
+        )
+        
+        # Turn away anything without a PDF header before writing it
+        head = read_head(stream)
+        if PDF_HEADER not in head:
+            entry = invalid_upload(original_filename, 'Not a PDF file')
+            return jsonify({'error': 'Invalid PDF file', 'files': [entry]}), 400
+        
+        file_path, spare_path = save_upload(stream, head)
+        
+        # The spare is probed if the stored file was released while probing
+        info = probe_pdf_file(file_path) or probe_pdf_file(spare_path)
+        entry = inspect_upload(file_path, original_filename, info)
+        if not entry['valid']:
+            return jsonify({'error': 'Invalid PDF file', 'files': [entry]}), 400
+        
+        if job_id:
+            # Re-check: the job may have been deleted or started while the
+            # body was streaming
+            with job_store.transaction():
+                job = job_store.get(job_id)
+                accepting = (job is not None and job['status'] == 'uploaded'
+                             and len(job['file_info']) < MAX_FILES_PER_JOB)
+                if accepting:
+                    place_upload(file_path, spare_path)
+                    job['uploaded_files'].append(file_path)
+                    job['file_info'].append(entry)
+                    job_store.update(job_id, uploaded_files=job['uploaded_files'],
+                                     file_info=job['file_info'])
+            
+            if not accepting:
+                release_upload(file_path)
+                return jsonify({'error': 'Job is no longer accepting files'}), 409
+        else:
+            job = create_job(str(uuid.uuid4()), [file_path], [entry])
+            with job_store.transaction():
+                place_upload(file_path, spare_path)
+                job_store.insert(job)
+        
+        return jsonify(job_upload_summary(job))
+        
+    except RequestEntityTooLarge:
+        return jsonify({'error': 'File too large. Maximum size is 1GB per streamed file.'}), 413
+    except Exception as e:
+        return jsonify({'error': f'Upload failed: {str(e)}'}), 500
+    finally:
+        if spare_path:
+            remove_file(spare_path)
 
 @app.route('/reorder', methods=['POST'])
 def reorder_files():
@@ -163,33 +532,83 @@ def reorder_files():
         job_id = data.get('job_id')
         new_order = data.get('order', [])
         
-        if job_id not in merge_jobs:
-            return jsonify({'error': 'Job not found'}), 404
+        if len(new_order) > MAX_FILES_PER_JOB:
+            return jsonify({'error': f'Too many files. Maximum is {MAX_FILES_PER_JOB} per job.'}), 400
         
-        job = merge_jobs[job_id]
-        if job['status'] != 'uploaded':
-            return jsonify({'error': 'Cannot reorder files after merge started'}), 400
+        with job_store.transaction():
+            job = job_store.get(job_id)
+            if job is None:
+                return jsonify({'error': 'Job not found'}), 404
+            
+            if job['status'] != 'uploaded':
+                return jsonify({'error': 'Cannot reorder files after merge started'}), 400
+            
+            # The order lists positions in file_info, the full list the
+            # client shows (invalid uploads included); files left out have
+            # been removed by the client
+            original_info = job['file_info']
+            if (len(set(new_order)) != len(new_order)
+                    or not all(isinstance(i, int) and 0 <= i < len(original_info)
+                               for i in new_order)):
+                return jsonify({'error': 'Order must list file positions at most once each'}), 400
+            
+            reordered_info = [original_info[i] for i in new_order]
+            reordered_files = [entry['path'] for entry in reordered_info if entry['valid']]
+            
+            job_store.update(job_id, uploaded_files=reordered_files,
+                             file_info=reordered_info)
         
-        # Reorder files based on indices
-        original_files = job['uploaded_files'].copy()
-        original_info = job['file_info'].copy()
+        # Delete the stored copies of removed files no other job uses
+        for file_path in set(job['uploaded_files']) - set(reordered_files):
+            release_upload(file_path)
         
-        reordered_files = []
-        reordered_info = []
-        
-        valid_indices = [i for i in new_order if 0 <= i < len(original_files)]
+        return jsonify({'success': True, 'files': reordered_info})
         
-        for index in valid_indices:
-            reordered_files.append(original_files[index])
-            reordered_info.append(original_info[index])
+    except Exception as e:
+        return jsonify({'error': f'Reorder failed: {str(e)}'}), 500
+
+def run_merge(job_id, input_files, output_path):
+    """
+    Merge a job's files on the merge executor and record the outcome.
+    
+    input_files is the job's file list as it was when the merge started,
+    so the worker never reads the file list from the store.
+    """
+    try:
+        last_progress = 0
         
-        job['uploaded_files'] = reordered_files
-        job['file_info'] = reordered_info
+        def progress_callback(current, total):
+            nonlocal last_progress
+            progress = int((current / total) * 100)
+            # Only write to the store when the percentage changes
+            if progress != last_progress:
+                last_progress = progress
+                job_store.update(job_id, progress=progress)
+                notify_job_change()
         
-        return jsonify({'success': True, 'files': reordered_info})
+        # Every file was parsed and validated when it was uploaded
+        success = merger.merge_pdfs(
+            list(input_files), 
+            output_path, 
+            progress_callback,
+            presumed_valid=True
+        )
         
+        if success:
+            completed = job_store.update(job_id, expected_status='merging',
+                                         status='completed',
+                                         output_path=output_path, progress=100)
+            if not completed:
+                # The job was deleted while merging
+                remove_file(output_path)
+        else:
+            job_store.update(job_id, status='failed', error='Merge operation failed')
+            
     except Exception as e:
-        return jsonify({'error': f'Reorder failed: {str(e)}'}), 500
+        job_store.update(job_id, status='failed', error=str(e))
+    finally:
+        merge_futures.pop(job_id, None)
+        notify_job_change()
 
 @app.route('/merge', methods=['POST'])
 def start_merge():
@@ -199,56 +618,34 @@ def start_merge():
         job_id = data.get('job_id')
         output_filename = data.get('output_filename', 'merged.pdf')
         
-        if job_id not in merge_jobs:
-            return jsonify({'error': 'Job not found'}), 404
-        
-        job = merge_jobs[job_id]
-        if job['status'] != 'uploaded':
-            return jsonify({'error': 'Job already processing or completed'}), 400
-        
-        if not job['uploaded_files']:
-            return jsonify({'error': 'No files to merge'}), 400
-        
         # Secure output filename
         output_filename = secure_filename(output_filename)
         if not output_filename.endswith('.pdf'):
             output_filename += '.pdf'
         
-        # Set job status
-        job['status'] = 'merging'
-        job['progress'] = 0
-        job['output_filename'] = output_filename
+        with job_store.transaction():
+            job = job_store.get(job_id)
+            if job is None:
+                return jsonify({'error': 'Job not found'}), 404
+            
+            if job['status'] != 'uploaded':
+                return jsonify({'error': 'Job already processing or completed'}), 400
+            
+            if not job['uploaded_files']:
+                return jsonify({'error': 'No files to merge'}), 400
+            
+            # Set job status
+            job_store.update(job_id, status='merging', progress=0,
+                             output_filename=output_filename)
+            files_snapshot = tuple(job['uploaded_files'])
         
-        # Start merge in background thread
-        def merge_thread():
-            try:
-                output_path = os.path.join(app.config['UPLOAD_FOLDER'], 
-                                         f"{job_id}_{output_filename}")
-                
-                def progress_callback(current, total):
-                    job['progress'] = int((current / total) * 100)
-                
-                success = merger.merge_pdfs(
-                    job['uploaded_files'], 
-                    output_path, 
-                    progress_callback
-                )
-                
-                if success:
-                    job['status'] = 'completed'
-                    job['output_path'] = output_path
-                    job['progress'] = 100
-                else:
-                    job['status'] = 'failed'
-                    job['error'] = 'Merge operation failed'
-                    
-            except Exception as e:
-                job['status'] = 'failed'
-                job['error'] = str(e)
-        
-        thread = threading.Thread(target=merge_thread)
-        thread.daemon = True
-        thread.start()
+        output_path = os.path.join(app.config['UPLOAD_FOLDER'],
+                                   f"{job_id}_{output_filename}")
+        
+        # Queue the merge; the future lets delete_job cancel it
+        merge_futures[job_id] = merge_executor.submit(
+            run_merge, job_id, files_snapshot, output_path
+        )
         
         return jsonify({'success': True, 'message': 'Merge started'})
         
@@ -258,27 +655,65 @@ def start_merge():
 @app.route('/status/<job_id>')
 def get_status(job_id):
     """Get job status and progress."""
-    if job_id not in merge_jobs:
+    job = job_store.get(job_id)
+    if job is None:
         return jsonify({'error': 'Job not found'}), 404
     
-    job = merge_jobs[job_id]
-    return jsonify({
-        'job_id': job_id,
-        'status': job['status'],
-        'progress': job['progress'],
-        'error': job.get('error'),
-        'output_filename': job.get('output_filename'),
-        'file_count': len(job['uploaded_files']),
-        'created_at': job['created_at']
+    # Everything else in the status only changes along with these
+    etag = f"{job['status']}-{job['progress']}-{len(job['uploaded_files'])}"
+    if request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+    else:
+        response = jsonify(job_status(job))
+    
+    # Pollers must revalidate, which costs a 304 while nothing has changed
+    response.set_etag(etag, weak=True)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+@app.route('/events/<job_id>')
+def job_events(job_id):
+    """Stream job status as Server-Sent Events until the merge finishes."""
+    if job_store.get(job_id) is None:
+        return jsonify({'error': 'Job not found'}), 404
+    
+    def generate():
+        last_status = None
+        while True:
+            with job_changes:
+                seen = job_change_count
+            
+            job = job_store.get(job_id)
+            if job is None:
+                return  # Deleted; the client's reconnect will get a 404
+            
+            status = job_status(job)
+            if status != last_status:
+                last_status = status
+                yield f"data: {app.json.dumps(status)}\n\n"
+            else:
+                # Comment line; lets the server notice a closed connection
+                yield ': keep-alive\n\n'
+            
+            if job['status'] in ('completed', 'failed'):
+                return
+            
+            with job_changes:
+                job_changes.wait_for(lambda: job_change_count != seen,
+                                     timeout=EVENT_WAIT_TIMEOUT)
+    
+    return Response(generate(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'  # Stop nginx from holding back events
     })
 
 @app.route('/download/<job_id>')
 def download_file(job_id):
     """Download the merged PDF file."""
-    if job_id not in merge_jobs:
+    job = job_store.get(job_id)
+    if job is None:
         return jsonify({'error': 'Job not found'}), 404
     
-    job = merge_jobs[job_id]
     if job['status'] != 'completed' or not job.get('output_path'):
         return jsonify({'error': 'File not ready for download'}), 400
     
@@ -286,8 +721,20 @@ def download_file(job_id):
     if not os.path.exists(output_path):
         return jsonify({'error': 'Output file not found'}), 404
     
-    output_filename = job.get('output_filename', 'merged.pdf')
+    output_filename = job.get('output_filename') or 'merged.pdf'
+    
+    accel_prefix = app.config['X_ACCEL_REDIRECT_PREFIX']
+    if accel_prefix:
+        # nginx sends the file itself; the worker only returns headers
+        response = Response(mimetype='application/pdf')
+        response.headers['X-Accel-Redirect'] = (
+            accel_prefix.rstrip('/') + '/' + quote(os.path.basename(output_path))
+        )
+        response.headers.set('Content-Disposition', 'attachment',
+                             filename=output_filename)
+        return response
     
+    # Sets X-Sendfile instead of sending the body when USE_X_SENDFILE is on
     return send_file(
         output_path,
         as_attachment=True,
@@ -298,29 +745,25 @@ def download_file(job_id):
 @app.route('/delete/<job_id>', methods=['DELETE'])
 def delete_job(job_id):
     """Delete a job and its files."""
-    if job_id not in merge_jobs:
-        return jsonify({'error': 'Job not found'}), 404
-    
-    job = merge_jobs[job_id]
+    with job_store.transaction():
+        job = job_store.get(job_id)
+        if job is None:
+            return jsonify({'error': 'Job not found'}), 404
+        
+        if job['status'] == 'merging':
+            # A merge still queued in this process can be dropped, but one
+            # that is running is reading the job's files
+            future = merge_futures.get(job_id)
+            if future is None or not future.cancel():
+                return jsonify({'error': 'Cannot delete a job while it is merging'}), 409
+            merge_futures.pop(job_id, None)
+        
+        # Remove job
+        job_store.delete(job_id)
     
-    # Clean up files
-    for file_path in job.get('uploaded_files', []):
-        try:
-            if os.path.exists(file_path):
-                os.remove(file_path)
-        except:
-            pass
+    notify_job_change()
     
-    # Clean up output file
-    output_path = job.get('output_path')
-    if output_path and os.path.exists(output_path):
-        try:
-            os.remove(output_path)
-        except:
-            pass
-    
-    # Remove job
-    del merge_jobs[job_id]
+    remove_job_files(job)
     
     return jsonify({'success': True})
 
@@ -9,8 +9,12 @@ import subprocess
 import webbrowser
 import time
 import threading
+import tempfile
 import os
 
+# Threads per gunicorn worker; each upload, download or event stream holds one
+GUNICORN_THREADS = 8
+
 def check_dependencies():
     """Check if all required web dependencies are installed."""
     missing_deps = []
@@ -37,6 +41,38 @@ def check_dependencies():
     
     return True
 
+def gunicorn_available():
+    """Check if gunicorn can be used to serve the app."""
+    try:
+        import gunicorn
+        return True
+    except ImportError:
+        return False
+
+def run_gunicorn():
+    """Serve the app with gunicorn, one worker process per CPU."""
+    # Merges and upload validation run in each worker's own pools, so more
+    # workers than CPUs would only oversubscribe them
+    workers = os.cpu_count() or 1
+    
+    # Workers must share uploads and the job database
+    env = os.environ.copy()
+    env.setdefault('PDF_MERGER_UPLOAD_FOLDER', tempfile.mkdtemp(prefix='pdf_merger_'))
+    # Each worker sizes its merge and validation pools to its share of the CPUs
+    env['PDF_MERGER_WEB_WORKERS'] = str(workers)
+    
+    # gthread rather than gevent: merges are CPU-bound and run on real
+    # threads and processes, which would stall a gevent worker's event loop
+    command = [
+        sys.executable, '-m', 'gunicorn',
+        '--workers', str(workers),
+        '--worker-class', 'gthread',
+        '--threads', str(GUNICORN_THREADS),
+        '--bind', '0.0.0.0:5000',
+        'pdf_merger_web:app'
+    ]
+    return subprocess.call(command, env=env)
+
 def open_browser():
     """Open browser after a short delay."""
     time.sleep(2)  # Wait for server to start
@@ -68,6 +104,11 @@ def main():
     browser_thread.start()
     
     try:
+        if gunicorn_available():
+            sys.exit(run_gunicorn())
+        
+        # Werkzeug's development server, when gunicorn isn't installed
+        # (it isn't available on Windows)
         from pdf_merger_web import app
         app.run(debug=False, host='0.0.0.0', port=5000)
     except ImportError as e:
@@ -9,6 +9,8 @@ class PDFMerger {
         this.files = [];
         this.sortable = null;
         this.progressInterval = null;
+        this.progressEvents = null;
+        this.orderUpdate = Promise.resolve();
         
         this.initializeElements();
         this.setupEventListeners();
@@ -142,6 +144,9 @@ class PDFMerger {
             this.jobId = result.job_id;
             this.files = result.files;
             
+            // Each file's position in the server's list, used for reordering
+            this.files.forEach((file, index) => { file.position = index; });
+            
             this.displayFiles();
             this.showControls();
             this.hideMessage();
@@ -245,24 +250,29 @@ class PDFMerger {
     async updateFileOrder() {
         if (!this.jobId) return;
         
-        try {
-            const validIndices = this.files
-                .map((file, index) => file.valid ? index : -1)
-                .filter(index => index !== -1);
-            
-            await fetch('/reorder', {
-                method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json'
-                },
-                body: JSON.stringify({
-                    job_id: this.jobId,
-                    order: validIndices
-                })
-            });
-        } catch (error) {
-            console.error('Failed to update file order:', error);
-        }
+        // Send the server-side position of every remaining file, invalid
+        // ones included, then renumber to match the server's new list
+        const order = this.files.map(file => file.position);
+        this.files.forEach((file, index) => { file.position = index; });
+        
+        // Chain updates so the server applies them in the order they were made
+        const jobId = this.jobId;
+        this.orderUpdate = this.orderUpdate.then(async () => {
+            try {
+                await fetch('/reorder', {
+                    method: 'POST',
+                    headers: {
+                        'Content-Type': 'application/json'
+                    },
+                    body: JSON.stringify({
+                        job_id: jobId,
+                        order: order
+                    })
+                });
+            } catch (error) {
+                console.error('Failed to update file order:', error);
+            }
+        });
     }
     
     async startMerge() {
@@ -272,6 +282,9 @@ class PDFMerger {
             return;
         }
         
+        // Merge the files in the order the user last arranged them
+        await this.orderUpdate;
+        
         const outputFilename = this.outputFilename.value.trim() || 'merged.pdf';
         
         try {
@@ -313,6 +326,26 @@ class PDFMerger {
     }
     
     startProgressMonitoring() {
+        if (!window.EventSource) {
+            this.startProgressPolling();
+            return;
+        }
+        
+        // The server pushes an event whenever the job's status changes
+        this.progressEvents = new EventSource(`/events/${this.jobId}`);
+        this.progressEvents.onmessage = (event) => {
+            this.handleStatus(JSON.parse(event.data));
+        };
+        this.progressEvents.onerror = () => {
+            // Dropped connections are retried automatically; CLOSED means
+            // the server refused the stream (e.g. the job is gone)
+            if (this.progressEvents && this.progressEvents.readyState === EventSource.CLOSED) {
+                this.onMergeError('Lost connection to the server');
+            }
+        };
+    }
+    
+    startProgressPolling() {
         this.progressInterval = setInterval(async () => {
             try {
                 const response = await fetch(`/status/${this.jobId}`);
@@ -322,13 +355,7 @@ class PDFMerger {
                     throw new Error(status.error || 'Status check failed');
                 }
                 
-                this.updateProgress(status);
-                
-                if (status.status === 'completed') {
-                    this.onMergeComplete(status);
-                } else if (status.status === 'failed') {
-                    this.onMergeError(status.error || 'Merge failed');
-                }
+                this.handleStatus(status);
                 
             } catch (error) {
                 this.onMergeError(error.message);
@@ -336,6 +363,27 @@ class PDFMerger {
         }, 500);
     }
     
+    stopProgressMonitoring() {
+        if (this.progressEvents) {
+            this.progressEvents.close();
+            this.progressEvents = null;
+        }
+        if (this.progressInterval) {
+            clearInterval(this.progressInterval);
+            this.progressInterval = null;
+        }
+    }
+    
+    handleStatus(status) {
+        this.updateProgress(status);
+        
+        if (status.status === 'completed') {
+            this.onMergeComplete(status);
+        } else if (status.status === 'failed') {
+            this.onMergeError(status.error || 'Merge failed');
+        }
+    }
+    
     updateProgress(status) {
         this.progressBar.style.width = `${status.progress}%`;
         
@@ -347,7 +395,7 @@ class PDFMerger {
     }
     
     onMergeComplete(status) {
-        clearInterval(this.progressInterval);
+        this.stopProgressMonitoring();
         this.progressContainer.style.display = 'none';
         this.downloadSection.style.display = 'block';
         
@@ -357,7 +405,7 @@ class PDFMerger {
     }
     
     onMergeError(error) {
-        clearInterval(this.progressInterval);
+        this.stopProgressMonitoring();
         this.progressContainer.style.display = 'none';
         this.showMessage(`Merge failed: ${error}`, 'error');
         
@@ -407,10 +455,7 @@ class PDFMerger {
         this.outputFilename.value = 'merged.pdf';
         this.hideMessage();
         
-        if (this.progressInterval) {
-            clearInterval(this.progressInterval);
-            this.progressInterval = null;
-        }
+        this.stopProgressMonitoring();
     }
     
     showMessage(message, type = 'info') {
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Tests for the PDF merger web application.
+Run with: python -m unittest test_web
+"""
+
+import io
+import os
+import signal
+import tempfile
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from unittest import mock
+
+# Keep the persistent PDF info cache out of the user's home directory
+os.environ.setdefault('PDF_MERGER_CACHE_DIR', tempfile.mkdtemp(prefix='pdf_merger_cache_'))
+
+from test_sample import create_sample_pdf
+import pdf_merger_web
+
+
+def sample_pdf_bytes(title, pages=1):
+    """Return the bytes of a sample PDF."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, f"{title}.pdf")
+        create_sample_pdf(path, title, pages)
+        with open(path, 'rb') as pdf_file:
+            return pdf_file.read()
+
+
+class ReorderTest(unittest.TestCase):
+    """Reordering a job that contains an invalid upload."""
+    
+    def setUp(self):
+        self.client = pdf_merger_web.app.test_client()
+        response = self.client.post('/upload', data={'files': [
+            (io.BytesIO(sample_pdf_bytes('A')), 'a.pdf'),
+            (io.BytesIO(b'%PDF-1.4 corrupt'), 'x.pdf'),
+            (io.BytesIO(sample_pdf_bytes('B', 2)), 'b.pdf'),
+        ]}, content_type='multipart/form-data')
+        self.assertEqual(response.status_code, 200)
+        self.job_id = response.get_json()['job_id']
+    
+    def tearDown(self):
+        self.client.delete(f'/delete/{self.job_id}')
+    
+    def reorder(self, order):
+        return self.client.post('/reorder', json={'job_id': self.job_id, 'order': order})
+    
+    def job_files(self):
+        job = pdf_merger_web.job_store.get(self.job_id)
+        names = [entry['filename'] for entry in job['file_info']]
+        paths = {entry['path']: entry['filename'] for entry in job['file_info'] if entry['valid']}
+        return names, [paths[path] for path in job['uploaded_files']]
+    
+    def test_moving_invalid_file_keeps_every_file(self):
+        # What the client sends after dragging x.pdf to the end
+        response = self.reorder([0, 2, 1])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.job_files(), (['a.pdf', 'b.pdf', 'x.pdf'], ['a.pdf', 'b.pdf']))
+    
+    def test_reorder_valid_files_around_invalid_one(self):
+        self.reorder([2, 1, 0])
+        self.assertEqual(self.job_files(), (['b.pdf', 'x.pdf', 'a.pdf'], ['b.pdf', 'a.pdf']))
+    
+    def test_omitted_file_is_removed(self):
+        a_path = pdf_merger_web.job_store.get(self.job_id)['uploaded_files'][0]
+        self.reorder([2, 1])
+        self.assertEqual(self.job_files(), (['b.pdf', 'x.pdf'], ['b.pdf']))
+        self.assertFalse(os.path.exists(a_path))
+    
+    def test_invalid_order_is_rejected(self):
+        for order in ([0, 0, 1], [0, 3], [-1], ['0']):
+            self.assertEqual(self.reorder(order).status_code, 400, order)
+        self.assertEqual(self.job_files(), (['a.pdf', 'x.pdf', 'b.pdf'], ['a.pdf', 'b.pdf']))
+
+
+
+class ValidatePoolTest(unittest.TestCase):
+    """Uploads keep working after a validation pool process dies."""
+    
+    def setUp(self):
+        self.client = pdf_merger_web.app.test_client()
+        self.saved_pool = pdf_merger_web.validate_pool
+        pdf_merger_web.validate_pool = ProcessPoolExecutor(max_workers=2)
+    
+    def tearDown(self):
+        pdf_merger_web.validate_pool.shutdown()
+        pdf_merger_web.validate_pool = self.saved_pool
+    
+    def upload(self):
+        response = self.client.post('/upload', data={'files': [
+            (io.BytesIO(sample_pdf_bytes('A')), 'a.pdf'),
+            (io.BytesIO(sample_pdf_bytes('B')), 'b.pdf'),
+        ]}, content_type='multipart/form-data')
+        self.assertEqual(response.status_code, 200)
+        body = response.get_json()
+        self.client.delete(f"/delete/{body['job_id']}")
+        return [entry['valid'] for entry in body['files']]
+    
+    def test_upload_after_pool_process_dies(self):
+        self.assertEqual(self.upload(), [True, True])
+        for process in list(pdf_merger_web.validate_pool._processes.values()):
+            os.kill(process.pid, signal.SIGKILL)
+        
+        self.assertEqual(self.upload(), [True, True])
+        self.assertEqual(self.upload(), [True, True])
+
+
+class SharedUploadTest(unittest.TestCase):
+    """Jobs uploading the same content share one stored file."""
+    
+    def setUp(self):
+        self.client = pdf_merger_web.app.test_client()
+        self.content = sample_pdf_bytes('Shared')
+    
+    def upload(self):
+        response = self.client.post('/upload', data={'files': [
+            (io.BytesIO(self.content), 'shared.pdf'),
+        ]}, content_type='multipart/form-data')
+        self.assertEqual(response.status_code, 200)
+        return response.get_json()
+    
+    def test_delete_while_same_content_is_uploading(self):
+        first = self.upload()
+        probe_uploads = pdf_merger_web.probe_uploads
+        
+        def delete_first_then_probe(file_paths):
+            # The other job goes away after the new copy was saved
+            self.client.delete(f"/delete/{first['job_id']}")
+            return probe_uploads(file_paths)
+        
+        with mock.patch.object(pdf_merger_web, 'probe_uploads', delete_first_then_probe):
+            second = self.upload()
+        
+        file_path = second['files'][0]['path']
+        self.assertTrue(os.path.exists(file_path))
+        # The spare copy kept while uploading is gone
+        self.assertFalse([name for name in os.listdir(os.path.dirname(file_path))
+                          if name.endswith('.part')])
+        self.client.delete(f"/delete/{second['job_id']}")
+        self.assertFalse(os.path.exists(file_path))
+
+
+if __name__ == '__main__':
+    unittest.main()